@@ -13,6 +13,14 @@ Disesuaikan untuk deployment di Railway dengan Environment Variables.
 5.  FIX: Menambahkan parser otomatis untuk URL repo agar tahan terhadap kesalahan format pada environment variable (memperbaiki error 404).
 6.  OPTIMASI: Perintah /list_tokens dioptimalkan untuk menghindari kelambatan.
 7.  FITUR BARU: Tugas latar belakang untuk membersihkan token yang kedaluwarsa secara otomatis.
+8.  DIAGNOSTIK: Monitor lag event loop (ambang via 'LOOP_LAG_THRESHOLD_MS') dan perintah /admin_profile untuk profil CPU & memori.
+9.  KEANDALAN: Circuit breaker GitHub. "File tidak ada" dibedakan dari "GitHub tidak tersedia"; saat GitHub down, klaim dijeda dan cek status memakai snapshot terakhir.
+10. ANALITIK: Event klaim, kedaluwarsa, dan reset dicatat append-only di 'ANALYTICS_DIR' dengan counter inkremental (/admin_stats, /admin_export_stats).
+    PENTING: 'ANALYTICS_DIR' ada di filesystem lokal container; di Railway arahkan ke Volume agar data tidak hilang saat redeploy.
+11. KONFIGURASI: TOKEN_SOURCES, durasi/prioritas role, ADMIN_USER_IDS, dan channel dapat diatur di 'CONFIG_FILE' dan dimuat ulang tanpa restart (/reload_config atau otomatis saat file berubah).
+12. OPTIMASI: DM token dikirim lewat antrean latar belakang yang persisten ('DM_QUEUE_FILE') dengan retry terbatas; balasan klaim langsung menyertakan token sebagai cadangan.
+    PENTING: 'DM_QUEUE_FILE' ada di filesystem lokal container; di Railway arahkan ke Volume agar antrean tidak hilang saat redeploy.
+13. OPTIMASI: 'LOW_MEMORY_MEMBERS' mematikan chunking & cache member penuh; nama member di-resolve per batch dengan cache LRU ber-TTL ('MEMBER_CACHE_SIZE', 'MEMBER_CACHE_TTL').
 """
 
 import discord
@@ -26,6 +34,17 @@ from datetime import datetime, timedelta, timezone
 import secrets
 import string
 import asyncio
+import sys
+import io
+import time
+import threading
+import traceback
+import cProfile
+import pstats
+import tracemalloc
+import csv
+import tempfile
+from collections import deque, OrderedDict
 from typing import List, Dict, Optional
 
 # --- [FIX] FUNGSI BARU UNTUK MEMBERSIHKAN SLUG REPO ---
@@ -51,20 +70,36 @@ def parse_repo_slug(repo_input: str) -> str:
     
     return repo_input
 
+def parse_duration(duration_str: str) -> timedelta:
+    try:
+        unit = duration_str[-1].lower(); value = int(duration_str[:-1])
+        if unit == 'd': return timedelta(days=value)
+        if unit == 'h': return timedelta(hours=value)
+        if unit == 'm': return timedelta(minutes=value)
+        if unit == 's': return timedelta(seconds=value)
+    except (ValueError, IndexError): raise ValueError("Format durasi tidak valid.")
+    raise ValueError(f"Unit durasi tidak dikenal: {unit}")
+
 # --- KONFIGURASI DARI ENVIRONMENT VARIABLES ---
 DISCORD_TOKEN = os.environ.get('DISCORD_TOKEN')
 GITHUB_TOKEN = os.environ.get('GITHUB_TOKEN')
 PRIMARY_REPO_INPUT = os.environ.get('PRIMARY_REPO', '')
 PRIMARY_REPO = parse_repo_slug(PRIMARY_REPO_INPUT) # [FIX] Terapkan pembersihan
 ALLOWED_GUILD_IDS_STR = os.environ.get('ALLOWED_GUILD_IDS', '')
-CLAIM_CHANNEL_ID = int(os.environ.get('CLAIM_CHANNEL_ID', 0))
-ROLE_REQUEST_CHANNEL_ID = int(os.environ.get('ROLE_REQUEST_CHANNEL_ID', 0))
-TOKEN_SOURCES_STR = os.environ.get('TOKEN_SOURCES', '')
-ADMIN_USER_IDS_STR = os.environ.get('ADMIN_USER_IDS', '')
-
-
-if not all([DISCORD_TOKEN, GITHUB_TOKEN, PRIMARY_REPO, ALLOWED_GUILD_IDS_STR, TOKEN_SOURCES_STR]):
-    print("FATAL ERROR: Pastikan semua variabel (DISCORD_TOKEN, GITHUB_TOKEN, PRIMARY_REPO, ALLOWED_GUILD_IDS, TOKEN_SOURCES) telah diatur.")
+CONFIG_FILE_PATH = os.environ.get('CONFIG_FILE', 'config.json')
+CONFIG_WATCH_INTERVAL = int(os.environ.get('CONFIG_WATCH_INTERVAL', 15))
+LOOP_LAG_THRESHOLD_MS = int(os.environ.get('LOOP_LAG_THRESHOLD_MS', 250))
+GITHUB_FAILURE_THRESHOLD = int(os.environ.get('GITHUB_FAILURE_THRESHOLD', 3))
+GITHUB_PROBE_INTERVAL = int(os.environ.get('GITHUB_PROBE_INTERVAL', 30))
+ANALYTICS_DIR = os.environ.get('ANALYTICS_DIR', 'analytics')
+DM_QUEUE_FILE = os.environ.get('DM_QUEUE_FILE', 'dm_queue.json')
+LOW_MEMORY_MEMBERS = os.environ.get('LOW_MEMORY_MEMBERS', '').lower() in ('1', 'true', 'yes')
+MEMBER_CACHE_SIZE = int(os.environ.get('MEMBER_CACHE_SIZE', 1000))
+MEMBER_CACHE_TTL = int(os.environ.get('MEMBER_CACHE_TTL', 600))
+
+
+if not all([DISCORD_TOKEN, GITHUB_TOKEN, PRIMARY_REPO, ALLOWED_GUILD_IDS_STR]):
+    print("FATAL ERROR: Pastikan semua variabel (DISCORD_TOKEN, GITHUB_TOKEN, PRIMARY_REPO, ALLOWED_GUILD_IDS) telah diatur.")
     if not PRIMARY_REPO:
         print(f"FATAL ERROR: PRIMARY_REPO ('{PRIMARY_REPO_INPUT}') tidak dapat di-parse ke format 'owner/repo'.")
     exit()
@@ -75,41 +110,141 @@ except ValueError:
     print("FATAL ERROR: Format ALLOWED_GUILD_IDS tidak valid.")
     exit()
 
-TOKEN_SOURCES: Dict[str, Dict[str, str]] = {}
-if TOKEN_SOURCES_STR:
+# --- PATH FILE DI REPOSITORY GITHUB ---
+CLAIMS_FILE_PATH = 'claims.json'
+
+# --- KONFIGURASI ROLE (DEFAULT, DAPAT DITIMPA FILE CONFIG) ---
+DEFAULT_ROLE_DURATIONS = {"vip": "30d", "supporter": "10d", "inner circle": "7d", "subscriber": "5d", "followers": "5d", "beginner": "3d"}
+DEFAULT_ROLE_PRIORITY = ["vip", "supporter", "inner circle", "subscriber", "followers", "beginner"]
+
+# --- KONFIGURASI YANG DAPAT DI-RELOAD (FILE CONFIG > ENVIRONMENT VARIABLES) ---
+def parse_token_source(alias: str, full_path: str) -> Dict[str, str]:
+    parts = full_path.strip().split('/')
+    # [FIX] Terapkan pembersihan pada slug repo dari TOKEN_SOURCES
+    raw_slug = '/'.join(parts[:-1]) # Gabungkan bagian repo
+    path = parts[-1] # Bagian terakhir adalah path file
+    cleaned_slug = parse_repo_slug(raw_slug)
+    if not path:
+        raise ValueError(f"Path file untuk sumber '{alias}' kosong.")
+    if len(cleaned_slug.split('/')) != 2:
+        print(f"WARNING: Slug token source '{alias}' ('{raw_slug}') mungkin tidak valid setelah di-parse.")
+    return {"slug": cleaned_slug, "path": path}
+
+def parse_token_sources(value) -> Dict[str, Dict[str, str]]:
+    """Menerima format env 'alias:owner/repo/file,...' atau dict {alias: 'owner/repo/file'} dari file config."""
+    if isinstance(value, str):
+        items = [item.split(':', 1) for item in value.split(',') if item.strip()]
+        if any(len(item) != 2 for item in items):
+            raise ValueError("Setiap sumber harus berformat 'alias:owner/repo/file'.")
+    elif isinstance(value, dict):
+        items = list(value.items())
+    else:
+        raise ValueError("token_sources harus berupa string atau object.")
+    sources = {alias.strip().lower(): parse_token_source(alias, str(full_path)) for alias, full_path in items}
+    if not sources:
+        raise ValueError("TOKEN_SOURCES kosong.")
+    return sources
+
+def parse_id_list(value) -> set:
+    if isinstance(value, str):
+        value = [uid for uid in value.split(',') if uid.strip()]
+    return {int(str(uid).strip()) for uid in value}
+
+def read_config_file() -> dict:
     try:
-        for item in TOKEN_SOURCES_STR.split(','):
-            alias, full_path = item.split(':', 1)
-            alias = alias.strip().lower()
-            parts = full_path.strip().split('/')
-            # [FIX] Terapkan pembersihan pada slug repo dari TOKEN_SOURCES
-            raw_slug = '/'.join(parts[:-1]) # Gabungkan bagian repo
-            path = parts[-1] # Bagian terakhir adalah path file
-            cleaned_slug = parse_repo_slug(raw_slug)
-            
-            if len(cleaned_slug.split('/')) != 2:
-                 print(f"WARNING: Slug token source '{alias}' ('{raw_slug}') mungkin tidak valid setelah di-parse.")
+        with open(CONFIG_FILE_PATH, encoding='utf-8') as f:
+            file_config = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"File config '{CONFIG_FILE_PATH}' tidak dapat dibaca: {e}")
+    if not isinstance(file_config, dict):
+        raise ValueError(f"File config '{CONFIG_FILE_PATH}' harus berisi object JSON.")
+    return file_config
+
+def config_file_mtime() -> Optional[float]:
+    try:
+        return os.stat(CONFIG_FILE_PATH).st_mtime
+    except OSError:
+        return None
 
-            TOKEN_SOURCES[alias] = {"slug": cleaned_slug, "path": path}
-    except Exception as e:
-        print(f"FATAL ERROR: Format TOKEN_SOURCES tidak valid. Error: {e}")
-        exit()
+def load_config() -> dict:
+    """Membaca dan memvalidasi seluruh konfigurasi yang dapat di-reload. Melempar ValueError jika ada yang tidak valid."""
+    file_config = read_config_file()
+    try:
+        token_sources = parse_token_sources(file_config.get("token_sources", os.environ.get('TOKEN_SOURCES', '')))
+        admin_user_ids = parse_id_list(file_config.get("admin_user_ids", os.environ.get('ADMIN_USER_IDS', '')))
+        claim_channel_id = int(file_config.get("claim_channel_id", os.environ.get('CLAIM_CHANNEL_ID', 0)))
+        role_request_channel_id = int(file_config.get("role_request_channel_id", os.environ.get('ROLE_REQUEST_CHANNEL_ID', 0)))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Format konfigurasi tidak valid: {e}")
+
+    raw_durations = file_config.get("role_durations", DEFAULT_ROLE_DURATIONS)
+    raw_priority = file_config.get("role_priority", DEFAULT_ROLE_PRIORITY)
+    if not isinstance(raw_durations, dict) or not isinstance(raw_priority, list):
+        raise ValueError("role_durations harus berupa object dan role_priority harus berupa list.")
+    role_durations = {str(role).lower(): str(duration) for role, duration in raw_durations.items()}
+    for role, duration in role_durations.items():
+        try:
+            parse_duration(duration)
+        except ValueError:
+            raise ValueError(f"Durasi '{duration}' untuk role '{role}' tidak valid.")
+    role_priority = [str(role).lower() for role in raw_priority]
+    missing_roles = [role for role in role_priority if role not in role_durations]
+    if missing_roles:
+        raise ValueError(f"Role tanpa durasi di role_priority: {', '.join(missing_roles)}")
+
+    return {
+        "token_sources": token_sources,
+        "role_durations": role_durations,
+        "role_priority": role_priority,
+        "admin_user_ids": admin_user_ids,
+        "claim_channel_id": claim_channel_id,
+        "role_request_channel_id": role_request_channel_id
+    }
+
+def apply_config(config: dict):
+    """Menukar seluruh nilai sekaligus. Tidak ada await di sini, sehingga handler lain tidak pernah melihat konfigurasi setengah jadi."""
+    global TOKEN_SOURCES, ROLE_DURATIONS, ROLE_PRIORITY, ADMIN_USER_IDS, CLAIM_CHANNEL_ID, ROLE_REQUEST_CHANNEL_ID
+    TOKEN_SOURCES = config["token_sources"]
+    ROLE_DURATIONS = config["role_durations"]
+    ROLE_PRIORITY = config["role_priority"]
+    ADMIN_USER_IDS = config["admin_user_ids"]
+    CLAIM_CHANNEL_ID = config["claim_channel_id"]
+    ROLE_REQUEST_CHANNEL_ID = config["role_request_channel_id"]
 
-# --- PATH FILE DI REPOSITORY GITHUB ---
-CLAIMS_FILE_PATH = 'claims.json'
+TOKEN_SOURCES: Dict[str, Dict[str, str]] = {}
+ROLE_DURATIONS: Dict[str, str] = {}
+ROLE_PRIORITY: List[str] = []
+ADMIN_USER_IDS: set = set()
+CLAIM_CHANNEL_ID = 0
+ROLE_REQUEST_CHANNEL_ID = 0
+loaded_config_mtime = config_file_mtime()
+try:
+    apply_config(load_config())
+except ValueError as e:
+    print(f"FATAL ERROR: Konfigurasi tidak valid (TOKEN_SOURCES, ADMIN_USER_IDS, role, atau channel). Error: {e}")
+    exit()
 
-# --- KONFIGURASI ROLE (TETAP) ---
-ROLE_DURATIONS = {"vip": "30d", "supporter": "10d", "inner circle": "7d", "subscriber": "5d", "followers": "5d", "beginner": "3d"}
-ROLE_PRIORITY = ["vip", "supporter", "inner circle", "subscriber", "followers", "beginner"]
+# --- NAMA ROLE UNTUK CHANNEL REQUEST ROLE (TETAP) ---
 SUBSCRIBER_ROLE_NAME = "Subscriber"
 FOLLOWER_ROLE_NAME = "Followers"
 FORGE_VERIFIED_ROLE_NAME = "Inner Circle"
 
+# --- PESAN MODE BACA-SAJA (GITHUB TIDAK TERSEDIA) ---
+CLAIM_PAUSED_MESSAGE = "⏸️ **Klaim dijeda sementara.** Penyimpanan data (GitHub) sedang tidak tersedia. Silakan coba lagi beberapa menit lagi."
+GITHUB_UNAVAILABLE_MESSAGE = "⚠️ GitHub sedang tidak tersedia, perubahan data tidak dapat disimpan saat ini."
+SNAPSHOT_FOOTER = "⚠️ GitHub tidak tersedia, data berasal dari snapshot terakhir dan mungkin belum terbaru."
+
 # --- SETUP BOT ---
 intents = discord.Intents.default()
 intents.members = True
 intents.message_content = True
-bot = commands.Bot(command_prefix="!unusedprefix!", intents=intents, help_command=None)
+bot_options = {}
+if LOW_MEMORY_MEMBERS:
+    # [OPTIMASI] Tanpa chunking & cache member penuh; nama member di-resolve sesuai kebutuhan lewat MemberNameCache.
+    bot_options.update(chunk_guilds_at_startup=False, member_cache_flags=discord.MemberCacheFlags.none())
+bot = commands.Bot(command_prefix="!unusedprefix!", intents=intents, help_command=None, **bot_options)
 
 # --- DECORATOR UNTUK ADMIN CHECK ---
 def is_admin():
@@ -118,23 +253,77 @@ def is_admin():
         return interaction.user.id in bot.admin_ids
     return app_commands.check(predicate)
 
+# --- CIRCUIT BREAKER UNTUK GITHUB ---
+class GitHubUnavailableError(Exception):
+    """GitHub tidak dapat dihubungi (timeout, error server, atau circuit sedang terbuka). Berbeda dengan file yang memang tidak ada."""
+
+class CircuitBreaker:
+    """Menolak permintaan ke GitHub secara instan setelah beberapa kegagalan beruntun, hingga probe latar belakang berhasil."""
+
+    def __init__(self, failure_threshold: int = 3):
+        self.failure_threshold = failure_threshold
+        self.failures = 0
+        self.opened_at: Optional[datetime] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def record_success(self):
+        if self.is_open:
+            print("GitHub kembali tersedia, circuit breaker ditutup.")
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if not self.is_open and self.failures >= self.failure_threshold:
+            self.opened_at = datetime.now(timezone.utc)
+            print(f"PERINGATAN: {self.failures} kegagalan GitHub beruntun, circuit breaker dibuka (mode baca-saja).")
+
+github_breaker = CircuitBreaker(GITHUB_FAILURE_THRESHOLD)
+last_good_claims: Optional[Dict[str, dict]] = None # Snapshot claims.json terakhir yang berhasil dibaca/disimpan
+
+def _is_outage_response(response: requests.Response) -> bool:
+    """Hanya error server dan rate limit yang dihitung sebagai gangguan; 403 karena izin PAT tidak boleh membuka circuit breaker."""
+    if response.status_code >= 500 or response.status_code == 429:
+        return True
+    if response.status_code == 403:
+        return response.headers.get('X-RateLimit-Remaining') == "0" or 'Retry-After' in response.headers
+    return False
+
 # --- FUNGSI BANTUAN ---
-def get_github_file(repo_slug: str, file_path: str) -> (Optional[str], Optional[str]):
+def get_github_file(repo_slug: str, file_path: str, bypass_breaker: bool = False) -> (Optional[str], Optional[str]):
+    """Mengembalikan (None, None) jika file tidak ada; melempar GitHubUnavailableError jika GitHub tidak dapat dibaca."""
+    if github_breaker.is_open and not bypass_breaker:
+        raise GitHubUnavailableError("Circuit breaker GitHub sedang terbuka.")
     url = f"https://api.github.com/repos/{repo_slug}/contents/{file_path}"
     headers = {"Authorization": f"token {GITHUB_TOKEN}", "Accept": "application/vnd.github.v3+json"}
     try:
         response = requests.get(url, headers=headers, timeout=10)
         if response.status_code == 200:
+            github_breaker.record_success()
             data = response.json()
             return base64.b64decode(data['content']).decode('utf-8'), data['sha']
         elif response.status_code == 404:
+            github_breaker.record_success()
             return None, None
+        if _is_outage_response(response):
+            github_breaker.record_failure()
         response.raise_for_status()
+        raise GitHubUnavailableError(f"Status tidak terduga {response.status_code}")
+    except requests.exceptions.HTTPError as e:
+        print(f"Error saat get file '{file_path}': {e}")
+        raise GitHubUnavailableError(str(e)) from e
     except requests.exceptions.RequestException as e:
+        github_breaker.record_failure()
         print(f"Error saat get file '{file_path}': {e}")
-    return None, None
+        raise GitHubUnavailableError(str(e)) from e
 
-def update_github_file(repo_slug: str, file_path: str, new_content: str, sha: Optional[str], commit_message: str) -> bool:
+def update_github_file(repo_slug: str, file_path: str, new_content: str, sha: Optional[str], commit_message: str, bypass_breaker: bool = False) -> bool:
+    if github_breaker.is_open and not bypass_breaker:
+        print(f"Update file '{file_path}' dibatalkan: circuit breaker GitHub sedang terbuka.")
+        return False
     url = f"https://api.github.com/repos/{repo_slug}/contents/{file_path}"
     headers = {"Authorization": f"token {GITHUB_TOKEN}", "Accept": "application/vnd.github.v3+json"}
     encoded_content = base64.b64encode(new_content.encode('utf-8')).decode('utf-8')
@@ -143,28 +332,403 @@ def update_github_file(repo_slug: str, file_path: str, new_content: str, sha: Op
         data["sha"] = sha
     try:
         response = requests.put(url, headers=headers, json=data, timeout=10)
+        if _is_outage_response(response):
+            github_breaker.record_failure()
         response.raise_for_status()
+        github_breaker.record_success()
         print(f"File '{file_path}' berhasil diupdate: {commit_message}")
         return True
+    except requests.exceptions.HTTPError as e:
+        print(f"Error saat update file '{file_path}': {e}")
+        return False
     except requests.exceptions.RequestException as e:
+        github_breaker.record_failure()
         print(f"Error saat update file '{file_path}': {e}")
         return False
 
-def parse_duration(duration_str: str) -> timedelta:
+def load_claims() -> (Dict[str, dict], Optional[str]):
+    """Membaca claims.json dan memperbarui snapshot terakhir. Melempar GitHubUnavailableError jika GitHub tidak tersedia."""
+    global last_good_claims
+    claims_content, claims_sha = get_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH)
+    claims_data = json.loads(claims_content if claims_content else '{}')
+    last_good_claims = json.loads(json.dumps(claims_data))
+    return claims_data, claims_sha
+
+def load_claims_for_status() -> (Dict[str, dict], bool):
+    """Untuk pengecekan status saja: memakai snapshot terakhir saat GitHub tidak tersedia. Nilai kedua True jika data berasal dari snapshot."""
     try:
-        unit = duration_str[-1].lower(); value = int(duration_str[:-1])
-        if unit == 'd': return timedelta(days=value)
-        if unit == 'h': return timedelta(hours=value)
-        if unit == 'm': return timedelta(minutes=value)
-        if unit == 's': return timedelta(seconds=value)
-    except (ValueError, IndexError): raise ValueError("Format durasi tidak valid.")
-    raise ValueError(f"Unit durasi tidak dikenal: {unit}")
+        return load_claims()[0], False
+    except GitHubUnavailableError:
+        if last_good_claims is None:
+            raise
+        return last_good_claims, True
+
+def save_claims(claims_data: Dict[str, dict], claims_sha: Optional[str], commit_message: str) -> bool:
+    global last_good_claims
+    if not update_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH, json.dumps(claims_data, indent=4), claims_sha, commit_message):
+        return False
+    last_good_claims = json.loads(json.dumps(claims_data))
+    return True
 
 def generate_random_token(role_name: str) -> str:
     random_part = ''.join(secrets.choice(string.ascii_uppercase + string.digits) for _ in range(4))
     date_part = datetime.now(timezone.utc).strftime('%Y%m%d')
     return f"{role_name.upper().replace(' ', '')}-{random_part}-{date_part}"
 
+# --- MONITOR LAG EVENT LOOP ---
+class LoopLagMonitor:
+    """Mendeteksi event loop yang tersendat (misal karena panggilan `requests` yang blocking) beserta stack penyebabnya."""
+
+    def __init__(self, threshold_ms: int, interval: float = 0.1, max_records: int = 50):
+        self.threshold = threshold_ms / 1000
+        self.interval = interval
+        self.stalls = deque(maxlen=max_records)
+        self._last_tick = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._pending_stack: Optional[str] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._heartbeat_task and not self._heartbeat_task.done():
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_tick = time.monotonic()
+        self._heartbeat_task = asyncio.get_running_loop().create_task(self._heartbeat())
+        threading.Thread(target=self._watchdog, name="loop-lag-watchdog", daemon=True).start()
+
+    async def _heartbeat(self):
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            lag = now - start - self.interval
+            # Perbarui tick dulu agar watchdog tidak sempat merekam stack heartbeat ini sebagai stall baru.
+            self._last_tick = now
+            stack, self._pending_stack = self._pending_stack, None
+            if lag >= self.threshold:
+                self.stalls.append({
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "lag_ms": round(lag * 1000),
+                    "stack": stack or "(stack tidak sempat direkam)"
+                })
+                print(f"PERINGATAN: Event loop tersendat selama {lag * 1000:.0f} ms.")
+
+    def _watchdog(self):
+        # Berjalan di thread terpisah agar tetap bisa merekam stack saat event loop sedang terblokir.
+        while True:
+            time.sleep(self.interval)
+            if self._pending_stack is None and time.monotonic() - self._last_tick >= self.threshold:
+                frame = sys._current_frames().get(self._loop_thread_id)
+                if frame is not None:
+                    self._pending_stack = "".join(traceback.format_stack(frame))
+
+    def format_report(self) -> str:
+        if not self.stalls:
+            return "Tidak ada lag event loop yang tercatat.\n"
+        lines = []
+        for stall in self.stalls:
+            lines.append(f"[{stall['timestamp']}] Lag {stall['lag_ms']} ms\n{stall['stack']}")
+        return "\n".join(lines)
+
+loop_lag_monitor = LoopLagMonitor(LOOP_LAG_THRESHOLD_MS)
+
+# --- ANALITIK KLAIM ---
+class ClaimAnalytics:
+    """Event log append-only (JSONL) dengan counter yang diperbarui per event, sehingga statistik tidak perlu memindai ulang claims.json."""
+
+    EVENT_FIELDS = ["timestamp", "type", "user_id", "role", "source_alias"]
+
+    def __init__(self, directory: str, hourly_retention_hours: int = 168):
+        self.events_path = os.path.join(directory, "claim_events.jsonl")
+        self.counters_path = os.path.join(directory, "claim_counters.json")
+        self.hourly_retention = timedelta(hours=hourly_retention_hours)
+        self.counters = self._load_counters()
+
+    def _empty_counters(self) -> dict:
+        return {
+            "total_claims": 0,
+            "by_role": {role: 0 for role in ROLE_PRIORITY},
+            "by_source": {},
+            "by_hour": {},
+            "by_day": {},
+            "cooldown_rejections": 0,
+            "expiries": 0,
+            "resets": 0
+        }
+
+    def _load_counters(self) -> dict:
+        counters = self._empty_counters()
+        try:
+            with open(self.counters_path, encoding='utf-8') as f:
+                counters.update(json.load(f))
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"PERINGATAN: Counter analitik tidak dapat dibaca, dimulai dari nol. Error: {e}")
+        return counters
+
+    def _save_counters(self):
+        tmp_path = f"{self.counters_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.counters, f)
+        os.replace(tmp_path, self.counters_path)
+
+    def _apply(self, event: dict, timestamp: datetime):
+        counters = self.counters
+        if event["type"] == "claim":
+            counters["total_claims"] += 1
+            counters["by_role"][event["role"]] = counters["by_role"].get(event["role"], 0) + 1
+            counters["by_source"][event["source_alias"]] = counters["by_source"].get(event["source_alias"], 0) + 1
+            hour_key, day_key = timestamp.strftime('%Y-%m-%dT%H'), timestamp.strftime('%Y-%m-%d')
+            counters["by_hour"][hour_key] = counters["by_hour"].get(hour_key, 0) + 1
+            counters["by_day"][day_key] = counters["by_day"].get(day_key, 0) + 1
+            # Hanya bucket per jam yang dipangkas; format kunci ISO membuat perbandingan string sama dengan urutan waktu.
+            cutoff = (timestamp - self.hourly_retention).strftime('%Y-%m-%dT%H')
+            for key in [key for key in counters["by_hour"] if key < cutoff]:
+                del counters["by_hour"][key]
+        elif event["type"] == "cooldown_rejection":
+            counters["cooldown_rejections"] += 1
+        elif event["type"] == "expiry":
+            counters["expiries"] += 1
+        elif event["type"] == "reset":
+            counters["resets"] += 1
+
+    def record_many(self, events: List[dict]):
+        if not events:
+            return
+        now = datetime.now(timezone.utc)
+        try:
+            os.makedirs(os.path.dirname(self.events_path) or '.', exist_ok=True)
+            with open(self.events_path, 'a', encoding='utf-8') as f:
+                for event in events:
+                    event = {"timestamp": now.isoformat(), **event}
+                    f.write(json.dumps(event) + "\n")
+                    self._apply(event, now)
+            self._save_counters()
+        except OSError as e:
+            print(f"PERINGATAN: Gagal mencatat event analitik: {e}")
+
+    def record(self, event_type: str, **fields):
+        self.record_many([{"type": event_type, **fields}])
+
+    def claims_in_last_hours(self, hours: int) -> int:
+        cutoff = (datetime.now(timezone.utc) - timedelta(hours=hours - 1)).strftime('%Y-%m-%dT%H')
+        return sum(count for key, count in self.counters["by_hour"].items() if key >= cutoff)
+
+    def export_csv(self):
+        """Mengalirkan event log baris per baris ke file CSV sementara; dipanggil di thread terpisah."""
+        output = tempfile.TemporaryFile(mode='w+b')
+        try:
+            text_output = io.TextIOWrapper(output, encoding='utf-8', newline='')
+            writer = csv.DictWriter(text_output, fieldnames=self.EVENT_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+            try:
+                # Batasi pembacaan ke ukuran file saat ekspor dimulai, karena record_many bisa menambah baris bersamaan.
+                size_limit = os.path.getsize(self.events_path)
+                bytes_read = 0
+                with open(self.events_path, 'rb') as f:
+                    for line_number, raw_line in enumerate(f, start=1):
+                        bytes_read += len(raw_line)
+                        if bytes_read > size_limit:
+                            break
+                        if not raw_line.strip():
+                            continue
+                        try:
+                            writer.writerow(json.loads(raw_line.decode('utf-8')))
+                        except (UnicodeDecodeError, json.JSONDecodeError, TypeError, AttributeError):
+                            print(f"PERINGATAN: Baris {line_number} di {self.events_path} rusak, dilewati saat ekspor.")
+            except FileNotFoundError:
+                pass
+            text_output.flush()
+            text_output.detach()
+        except Exception:
+            output.close()
+            raise
+        output.seek(0)
+        return output
+
+claim_analytics = ClaimAnalytics(ANALYTICS_DIR)
+
+# --- ANTREAN PENGIRIMAN DM ---
+class DMDeliveryQueue:
+    """Mengirim DM token di latar belakang dengan jeda antar kiriman dan retry terbatas. Antrean disimpan ke file agar tidak hilang saat restart."""
+
+    def __init__(self, path: str, max_attempts: int = 5, pacing: float = 1.0, base_retry_delay: float = 10.0):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.pacing = pacing
+        self.base_retry_delay = base_retry_delay
+        self.pending: Dict[str, dict] = self._load()
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_task: Optional[asyncio.Task] = None
+        self._retry_tasks = set()
+
+    def _load(self) -> Dict[str, dict]:
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return {entry["id"]: entry for entry in json.load(f)}
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError, KeyError, TypeError) as e:
+            print(f"PERINGATAN: Antrean DM tidak dapat dibaca, dimulai kosong. Error: {e}")
+            return {}
+
+    def _save(self):
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(list(self.pending.values()), f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"PERINGATAN: Gagal menyimpan antrean DM: {e}")
+
+    def start(self, bot_instance: commands.Bot):
+        if self._worker_task and not self._worker_task.done():
+            return
+        self.bot = bot_instance
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            for entry_id in self.pending:
+                self._queue.put_nowait(entry_id)
+            if self.pending:
+                print(f"Melanjutkan {len(self.pending)} pengiriman DM yang tertunda.")
+        self._worker_task = asyncio.get_running_loop().create_task(self._worker())
+        self._worker_task.add_done_callback(self._on_worker_done)
+
+    def _on_worker_done(self, task: asyncio.Task):
+        if task.cancelled():
+            return
+        # Worker tidak boleh mati diam-diam; jalankan ulang agar antrean tetap diproses tanpa menunggu on_ready.
+        print(f"KRITIS: Worker antrean DM berhenti ({task.exception()!r}), dijalankan ulang.")
+        self.start(self.bot)
+
+    def enqueue(self, user_id: int, content: str):
+        entry_id = secrets.token_hex(8)
+        self.pending[entry_id] = {"id": entry_id, "user_id": user_id, "content": content, "attempts": 0}
+        self._save()
+        if self._queue is not None:
+            self._queue.put_nowait(entry_id)
+
+    async def _retry_later(self, entry_id: str, delay: float):
+        await asyncio.sleep(delay)
+        self._queue.put_nowait(entry_id)
+
+    def _schedule_retry(self, entry_id: str, entry: dict, error: Exception, retry_after: Optional[float] = None):
+        entry["attempts"] += 1
+        if entry["attempts"] >= self.max_attempts:
+            print(f"KRITIS: DM untuk user {entry['user_id']} gagal setelah {entry['attempts']} percobaan: {error!r}")
+            self.pending.pop(entry_id, None)
+        else:
+            delay = retry_after or self.base_retry_delay * (2 ** (entry["attempts"] - 1))
+            print(f"DM untuk user {entry['user_id']} gagal ({error!r}), dicoba lagi dalam {delay:.0f} detik.")
+            retry_task = asyncio.get_running_loop().create_task(self._retry_later(entry_id, delay))
+            self._retry_tasks.add(retry_task)
+            retry_task.add_done_callback(self._retry_tasks.discard)
+        self._save()
+
+    async def _worker(self):
+        while True:
+            entry_id = await self._queue.get()
+            entry = self.pending.get(entry_id)
+            if entry is None:
+                continue
+            try:
+                user = self.bot.get_user(entry["user_id"]) or await self.bot.fetch_user(entry["user_id"])
+                await user.send(entry["content"])
+            except (discord.Forbidden, discord.NotFound):
+                # DM tertutup atau pengguna tidak ditemukan: tidak perlu retry, token sudah ada di balasan ephemeral.
+                print(f"DM untuk user {entry['user_id']} tidak dapat dikirim (DM tertutup atau pengguna tidak ada).")
+                self.pending.pop(entry_id, None)
+                self._save()
+            except discord.HTTPException as e:
+                self._schedule_retry(entry_id, entry, e, getattr(e, 'retry_after', None))
+            except Exception as e:
+                # Timeout, error koneksi (aiohttp/OSError), dll. dianggap sementara dan dicoba ulang.
+                self._schedule_retry(entry_id, entry, e)
+            else:
+                self.pending.pop(entry_id, None)
+                self._save()
+            await asyncio.sleep(self.pacing)
+
+dm_queue = DMDeliveryQueue(DM_QUEUE_FILE)
+
+# --- CACHE NAMA MEMBER (MODE HEMAT MEMORI) ---
+class MemberNameCache:
+    """Cache LRU ber-TTL untuk nama member. Member yang belum ada di-resolve per batch lewat query_members, dengan fetch_member sebagai cadangan."""
+
+    QUERY_BATCH_SIZE = 100 # Batas user_ids per permintaan query_members dari Discord
+    MAX_FALLBACK_FETCHES = 10 # Batas panggilan fetch_member per resolve saat query_members gagal
+    FALLBACK_FETCH_DELAY = 0.25
+
+    def __init__(self, max_size: int, ttl: int):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+
+    def get(self, guild_id: int, user_id: int) -> (bool, Optional[str]):
+        entry = self._entries.get((guild_id, user_id))
+        if entry is None or entry[0] < time.monotonic():
+            self._entries.pop((guild_id, user_id), None)
+            return False, None
+        self._entries.move_to_end((guild_id, user_id))
+        return True, entry[1]
+
+    def put(self, guild_id: int, user_id: int, name: Optional[str]):
+        self._entries[(guild_id, user_id)] = (time.monotonic() + self.ttl, name)
+        self._entries.move_to_end((guild_id, user_id))
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def _fetch_batch(self, guild: discord.Guild, user_ids: List[int], fetch_budget: int) -> (Dict[int, Optional[str]], int):
+        """Mengembalikan ({user_id: nama atau None jika pasti tidak ada di server}, jumlah fetch_member yang dipakai).
+        ID yang gagal di-resolve karena error sementara tidak dimasukkan, agar tidak di-cache sebagai "tidak ada"."""
+        try:
+            members = await guild.query_members(user_ids=user_ids, limit=len(user_ids), cache=False)
+            found = {member.id: str(member) for member in members}
+            return {user_id: found.get(user_id) for user_id in user_ids}, 0
+        except (asyncio.TimeoutError, discord.ClientException):
+            resolved = {}
+            fetch_calls = 0
+            # Cadangan REST dibatasi dan diberi jeda agar satu /list_tokens tidak membanjiri API.
+            for user_id in user_ids[:fetch_budget]:
+                if fetch_calls:
+                    await asyncio.sleep(self.FALLBACK_FETCH_DELAY)
+                fetch_calls += 1
+                try:
+                    resolved[user_id] = str(await guild.fetch_member(user_id))
+                except discord.NotFound:
+                    resolved[user_id] = None
+                except discord.HTTPException as e:
+                    print(f"Gagal mengambil member {user_id}: {e}")
+            return resolved, fetch_calls
+
+    async def resolve(self, guild: discord.Guild, user_ids: List[int]) -> Dict[int, Optional[str]]:
+        """Mengembalikan {user_id: nama}; nilai None berarti pengguna tidak ada di server.
+        ID yang tidak ada di hasil belum bisa di-resolve saat ini."""
+        names, missing = {}, []
+        for user_id in user_ids:
+            member = guild.get_member(user_id)
+            if member:
+                names[user_id] = str(member)
+                continue
+            found, name = self.get(guild.id, user_id)
+            if found:
+                names[user_id] = name
+            else:
+                missing.append(user_id)
+
+        fetch_budget = self.MAX_FALLBACK_FETCHES
+        for i in range(0, len(missing), self.QUERY_BATCH_SIZE):
+            batch = missing[i:i + self.QUERY_BATCH_SIZE]
+            resolved, fetch_calls = await self._fetch_batch(guild, batch, fetch_budget)
+            fetch_budget -= fetch_calls
+            for user_id, name in resolved.items():
+                names[user_id] = name
+                self.put(guild.id, user_id, name)
+        return names
+
+member_names = MemberNameCache(MEMBER_CACHE_SIZE, MEMBER_CACHE_TTL)
+
 # --- KELAS PANEL INTERAKTIF ---
 class ClaimPanelView(ui.View):
     def __init__(self, bot_instance):
@@ -176,13 +740,19 @@ class ClaimPanelView(ui.View):
         if not self.bot.current_claim_source_alias:
             await interaction.response.send_message("❌ Sesi klaim saat ini sedang ditutup oleh admin.", ephemeral=True)
             return
+        if github_breaker.is_open:
+            await interaction.response.send_message(CLAIM_PAUSED_MESSAGE, ephemeral=True)
+            return
 
         await interaction.response.defer(ephemeral=True, thinking=True)
         user, user_id, current_time = interaction.user, str(interaction.user.id), datetime.now(timezone.utc)
         
         async with self.bot.github_lock:
-            claims_content, claims_sha = get_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH)
-            claims_data = json.loads(claims_content if claims_content else '{}')
+            try:
+                claims_data, claims_sha = load_claims()
+            except GitHubUnavailableError:
+                # [FIX] Jangan pernah menganggap claims.json kosong saat GitHub gagal dibaca, agar cooldown tidak terlewati.
+                await interaction.followup.send(CLAIM_PAUSED_MESSAGE, ephemeral=True); return
 
             if user_id in claims_data:
                 user_claim_info = claims_data[user_id]
@@ -190,24 +760,31 @@ class ClaimPanelView(ui.View):
                     last_claim_time = datetime.fromisoformat(user_claim_info['last_claim_timestamp'])
                     if current_time < last_claim_time + timedelta(days=7):
                         next_claim_time = last_claim_time + timedelta(days=7)
+                        claim_analytics.record("cooldown_rejection", user_id=user_id)
                         await interaction.followup.send(f"❌ **Cooldown!** Anda baru bisa klaim lagi pada {next_claim_time.strftime('%d %B %Y, %H:%M')} UTC.", ephemeral=True); return
                 
                 if 'current_token' in user_claim_info and 'token_expiry_timestamp' in user_claim_info and datetime.fromisoformat(user_claim_info['token_expiry_timestamp']) > current_time:
                     await interaction.followup.send(f"❌ Token Anda saat ini masih aktif.", ephemeral=True); return
 
+            # Role dibaca dari payload interaksi (interaction.user), tidak bergantung pada cache member.
             user_role_names = [role.name.lower() for role in user.roles]
             claim_role = next((role for role in ROLE_PRIORITY if role in user_role_names), None)
             if not claim_role:
                 await interaction.followup.send("❌ Anda tidak memiliki peran yang valid untuk klaim token.", ephemeral=True); return
             
             source_alias = self.bot.current_claim_source_alias
-            token_source_info = TOKEN_SOURCES[source_alias]
+            token_source_info = TOKEN_SOURCES.get(source_alias)
+            if not token_source_info:
+                await interaction.followup.send("❌ Sumber token untuk sesi ini sudah tidak tersedia. Hubungi admin.", ephemeral=True); return
             target_repo_slug, target_file_path = token_source_info["slug"], token_source_info["path"]
             duration_str = ROLE_DURATIONS[claim_role]
             duration_delta = parse_duration(duration_str)
             new_token = generate_random_token(claim_role)
             
-            tokens_content, tokens_sha = get_github_file(target_repo_slug, target_file_path)
+            try:
+                tokens_content, tokens_sha = get_github_file(target_repo_slug, target_file_path)
+            except GitHubUnavailableError:
+                await interaction.followup.send(CLAIM_PAUSED_MESSAGE, ephemeral=True); return
             new_tokens_content = (tokens_content or "").strip() + f"\n\n{new_token}\n\n"
             token_add_success = update_github_file(target_repo_slug, target_file_path, new_tokens_content, tokens_sha, f"Bot: Add token for {user.name}")
             
@@ -221,32 +798,37 @@ class ClaimPanelView(ui.View):
                 "token_expiry_timestamp": (current_time + duration_delta).isoformat(), 
                 "source_alias": source_alias
             }
-            claim_db_update_success = update_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH, json.dumps(claims_data, indent=4), claims_sha, f"Bot: Update claim for {user.name}")
+            claim_db_update_success = save_claims(claims_data, claims_sha, f"Bot: Update claim for {user.name}")
 
             if not claim_db_update_success:
                 print(f"KRITIS: Gagal menyimpan claim untuk {user.name}. Melakukan rollback token.")
-                current_tokens_content, current_tokens_sha = get_github_file(target_repo_slug, target_file_path)
+                try:
+                    current_tokens_content, current_tokens_sha = get_github_file(target_repo_slug, target_file_path, bypass_breaker=True)
+                except GitHubUnavailableError:
+                    current_tokens_content, current_tokens_sha = None, None
+                    print(f"KRITIS: Rollback token '{new_token}' gagal, GitHub tidak tersedia. Hapus manual dari `{target_file_path}`.")
                 if current_tokens_content and new_token in current_tokens_content:
                     lines = [line for line in current_tokens_content.split('\n\n') if line.strip() and line.strip() != new_token]
                     content_after_removal = "\n\n".join(lines) + ("\n\n" if lines else "")
-                    rollback_success = update_github_file(target_repo_slug, target_file_path, content_after_removal, current_tokens_sha, f"Bot: ROLLBACK token for {user.name}")
+                    rollback_success = update_github_file(target_repo_slug, target_file_path, content_after_removal, current_tokens_sha, f"Bot: ROLLBACK token for {user.name}", bypass_breaker=True)
                     print(f"Status Rollback: {'Berhasil' if rollback_success else 'Gagal'}")
                 await interaction.followup.send("❌ **Klaim Gagal!** Terjadi kesalahan saat menyimpan data klaim Anda. Token tidak dapat diberikan. Silakan hubungi admin.", ephemeral=True)
                 return
 
-        try:
-            await user.send(f"🎉 **Token Anda Berhasil Diklaim!**\n\n**Sumber:** `{source_alias.title()}`\n**Token Anda:** ```{new_token}```\n**Role:** `{claim_role.title()}`\nAktif selama **{duration_str.replace('d', ' hari')}**.")
-            await interaction.followup.send("✅ **Berhasil!** Token Anda telah dikirim melalui DM.", ephemeral=True)
-        except discord.Forbidden:
-            await interaction.followup.send("⚠️ Gagal mengirim DM. Token Anda tetap dibuat dan tersimpan.", ephemeral=True)
+        claim_analytics.record("claim", user_id=user_id, role=claim_role, source_alias=source_alias)
+        # DM dikirim oleh antrean latar belakang; balasan ephemeral langsung menyertakan token sebagai cadangan jika DM tertutup.
+        dm_queue.enqueue(user.id, f"🎉 **Token Anda Berhasil Diklaim!**\n\n**Sumber:** `{source_alias.title()}`\n**Token Anda:** ```{new_token}```\n**Role:** `{claim_role.title()}`\nAktif selama **{duration_str.replace('d', ' hari')}**.")
+        await interaction.followup.send(f"✅ **Berhasil!** Token Anda sedang dikirim melalui DM.\nJika DM Anda tertutup, simpan token ini: ||`{new_token}`||", ephemeral=True)
 
     @ui.button(label="Cek Token Saya", style=discord.ButtonStyle.secondary, custom_id="check_token_button")
     async def check_button_callback(self, interaction: discord.Interaction, button: ui.Button):
         await interaction.response.defer(ephemeral=True, thinking=True)
         user_id = str(interaction.user.id)
         
-        claims_content, _ = get_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH)
-        claims_data = json.loads(claims_content if claims_content else '{}')
+        try:
+            claims_data, from_snapshot = load_claims_for_status()
+        except GitHubUnavailableError:
+            await interaction.followup.send("⚠️ Data klaim sedang tidak dapat dibaca karena GitHub tidak tersedia. Silakan coba lagi nanti.", ephemeral=True); return
 
         if user_id not in claims_data:
             await interaction.followup.send("Anda belum pernah melakukan klaim token.", ephemeral=True); return
@@ -272,6 +854,8 @@ class ClaimPanelView(ui.View):
         else:
             embed.add_field(name="Cooldown Klaim", value="Anda bisa klaim token sekarang.", inline=False)
 
+        if from_snapshot:
+            embed.set_footer(text=SNAPSHOT_FOOTER)
         await interaction.followup.send(embed=embed, ephemeral=True)
 
 # --- AUTOCOMPLETE & PERINTAH ---
@@ -296,6 +880,10 @@ async def help_command(interaction: discord.Interaction):
             "**/list_sources**: Menampilkan semua sumber token.\n"
             "**/baca_file**: Membaca file dari sumber token.\n"
             "**/show_config**: Menampilkan konfigurasi channel.\n"
+            "**/reload_config**: Memuat ulang konfigurasi tanpa restart.\n"
+            "**/admin_profile**: Merekam profil CPU & memori bot.\n"
+            "**/admin_stats**: Menampilkan statistik klaim.\n"
+            "**/admin_export_stats**: Mengunduh riwayat event klaim (CSV).\n"
             "**/serverlist**: Menampilkan daftar server bot."), inline=False)
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -419,8 +1007,24 @@ async def admin_add_shared_token(interaction: discord.Interaction, alias: str, t
             return
 
         # Langkah 2b: Tambahkan data token ke claims.json
-        claims_content, claims_sha = get_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH)
-        claims_data = json.loads(claims_content if claims_content else '{}')
+        try:
+            claims_data, claims_sha = load_claims()
+        except GitHubUnavailableError:
+            claims_data, claims_sha = None, None
+
+        if claims_data is None:
+            print(f"KRITIS: Gagal membaca claims.json untuk token shared '{token}'. Melakukan rollback.")
+            try:
+                current_tokens_content_rb, current_tokens_sha_rb = get_github_file(target_repo_slug, target_file_path, bypass_breaker=True)
+            except GitHubUnavailableError:
+                current_tokens_content_rb, current_tokens_sha_rb = None, None
+            if current_tokens_content_rb and token in current_tokens_content_rb:
+                lines = [line for line in current_tokens_content_rb.split('\n\n') if line.strip() and line.strip() != token]
+                content_after_removal = "\n\n".join(lines) + ("\n\n" if lines else "")
+                rollback_success = update_github_file(target_repo_slug, target_file_path, content_after_removal, current_tokens_sha_rb, f"Admin: ROLLBACK shared token {token}", bypass_breaker=True)
+                print(f"Status Rollback: {'Berhasil' if rollback_success else 'Gagal'}")
+            await interaction.followup.send(f"❌ {GITHUB_UNAVAILABLE_MESSAGE} Penambahan token dibatalkan.", ephemeral=True)
+            return
         
         # [FIX] Gunakan ID unik dengan alias agar tidak bentrok
         claim_key = f"shared_{alias.lower()}_{token}" 
@@ -443,16 +1047,19 @@ async def admin_add_shared_token(interaction: discord.Interaction, alias: str, t
             "is_shared": True # Penanda opsional
         }
         
-        claim_db_update_success = update_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH, json.dumps(claims_data, indent=4), claims_sha, f"Admin: Add data for shared token {token}")
+        claim_db_update_success = save_claims(claims_data, claims_sha, f"Admin: Add data for shared token {token}")
         
         # Langkah 2c: Rollback jika penyimpanan database gagal
         if not claim_db_update_success:
             print(f"KRITIS: Gagal menyimpan data klaim untuk token shared '{token}'. Melakukan rollback.")
-            current_tokens_content_rb, current_tokens_sha_rb = get_github_file(target_repo_slug, target_file_path)
+            try:
+                current_tokens_content_rb, current_tokens_sha_rb = get_github_file(target_repo_slug, target_file_path, bypass_breaker=True)
+            except GitHubUnavailableError:
+                current_tokens_content_rb, current_tokens_sha_rb = None, None
             if current_tokens_content_rb and token in current_tokens_content_rb:
                 lines = [line for line in current_tokens_content_rb.split('\\n\\n') if line.strip() and line.strip() != token]
                 content_after_removal = "\\n\\n".join(lines) + ("\\n\\n" if lines else "")
-                rollback_success = update_github_file(target_repo_slug, target_file_path, content_after_removal, current_tokens_sha_rb, f"Admin: ROLLBACK shared token {token}")
+                rollback_success = update_github_file(target_repo_slug, target_file_path, content_after_removal, current_tokens_sha_rb, f"Admin: ROLLBACK shared token {token}", bypass_breaker=True)
                 print(f"Status Rollback: {'Berhasil' if rollback_success else 'Gagal'}")
             
             await interaction.followup.send("❌ Gagal menyimpan data token ke database. Token di file sumber telah dihapus kembali.", ephemeral=True)
@@ -496,14 +1103,14 @@ async def admin_reset_cooldown(interaction: discord.Interaction, user: discord.M
     await interaction.response.defer(ephemeral=True)
     user_id = str(user.id)
     async with bot.github_lock:
-        claims_content, claims_sha = get_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH)
-        claims_data = json.loads(claims_content if claims_content else '{}')
+        claims_data, claims_sha = load_claims()
         if user_id not in claims_data:
             await interaction.followup.send(f"ℹ️ {user.mention} belum pernah klaim.", ephemeral=True); return
         
         del claims_data[user_id]
             
-        if update_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH, json.dumps(claims_data, indent=4), claims_sha, f"Admin: Reset data for {user.name}"):
+        if save_claims(claims_data, claims_sha, f"Admin: Reset data for {user.name}"):
+            claim_analytics.record("reset", user_id=user_id)
             await interaction.followup.send(f"✅ Seluruh data klaim untuk {user.mention} berhasil direset.", ephemeral=True)
         else:
             await interaction.followup.send(f"❌ Gagal mereset data untuk {user.mention}.", ephemeral=True)
@@ -512,8 +1119,10 @@ async def admin_reset_cooldown(interaction: discord.Interaction, user: discord.M
 @is_admin()
 async def admin_cek_user(interaction: discord.Interaction, user: discord.Member):
     await interaction.response.defer(ephemeral=True)
-    claims_content, _ = get_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH)
-    claims_data = json.loads(claims_content if claims_content else '{}')
+    # Member parameter sudah di-resolve dari payload interaksi; simpan agar /list_tokens tidak perlu query ulang.
+    if interaction.guild:
+        member_names.put(interaction.guild.id, user.id, str(user))
+    claims_data, from_snapshot = load_claims_for_status()
 
     if str(user.id) not in claims_data:
         await interaction.followup.send(f"**{user.display_name}** belum pernah klaim.", ephemeral=True); return
@@ -539,6 +1148,8 @@ async def admin_cek_user(interaction: discord.Interaction, user: discord.Member)
             embed.add_field(name="Bisa Klaim Lagi", value="Sekarang", inline=False)
     else:
         embed.add_field(name="Cooldown Klaim", value="Pengguna tidak dalam masa cooldown.", inline=False)
+    if from_snapshot:
+        embed.set_footer(text=SNAPSHOT_FOOTER)
     await interaction.followup.send(embed=embed, ephemeral=True)
 
 @bot.tree.command(name="list_tokens", description="ADMIN: Menampilkan daftar semua token aktif dari database.")
@@ -552,8 +1163,7 @@ async def list_tokens(interaction: discord.Interaction):
         await interaction.followup.send("Perintah ini harus dijalankan di dalam server.", ephemeral=True)
         return
 
-    claims_content, _ = get_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH)
-    claims_data = json.loads(claims_content if claims_content else '{}')
+    claims_data, from_snapshot = load_claims_for_status()
 
     if not claims_data:
         await interaction.followup.send("Tidak ada data klaim.", ephemeral=True); return
@@ -562,20 +1172,26 @@ async def list_tokens(interaction: discord.Interaction):
     active_tokens = []
     current_time = datetime.now(timezone.utc)
 
-    for key, data in claims_data.items():
-        if 'current_token' in data and 'token_expiry_timestamp' in data and datetime.fromisoformat(data["token_expiry_timestamp"]) > current_time:
-            username = f"Shared Key: {key}" # Default untuk shared token
-            if key.isdigit():
-                # [OPTIMASI] Gunakan get_member dari cache, jauh lebih cepat
-                member = guild.get_member(int(key))
-                if member:
-                    username = str(member)
-                else:
-                    username = f"User ID: {key} (Not in server)"
-            
-            active_tokens.append(f"**{username}**: `{data['current_token']}` (Sumber: {data.get('source_alias', 'N/A').title()})")
+    active_claims = [(key, data) for key, data in claims_data.items()
+                     if 'current_token' in data and 'token_expiry_timestamp' in data and datetime.fromisoformat(data["token_expiry_timestamp"]) > current_time]
+    # [OPTIMASI] Resolve semua nama sekaligus: cache discord.py, lalu cache LRU, lalu query_members per batch.
+    resolved_names = await member_names.resolve(guild, [int(key) for key, _ in active_claims if key.isdigit()])
+
+    for key, data in active_claims:
+        username = f"Shared Key: {key}" # Default untuk shared token
+        if key.isdigit():
+            if int(key) not in resolved_names:
+                username = f"User ID: {key}"
+            elif resolved_names[int(key)]:
+                username = resolved_names[int(key)]
+            else:
+                username = f"User ID: {key} (Not in server)"
+        
+        active_tokens.append(f"**{username}**: `{data['current_token']}` (Sumber: {data.get('source_alias', 'N/A').title()})")
 
     embed.description = "\n".join(active_tokens) if active_tokens else "Tidak ada token yang sedang aktif."
+    if from_snapshot:
+        embed.set_footer(text=SNAPSHOT_FOOTER)
     await interaction.followup.send(embed=embed, ephemeral=True)
 
 @bot.tree.command(name="show_config", description="ADMIN: Menampilkan channel yang terkonfigurasi.")
@@ -584,7 +1200,9 @@ async def show_config(interaction: discord.Interaction):
     embed = discord.Embed(title="🔧 Konfigurasi Channel Bot", color=discord.Color.teal())
     embed.add_field(name="Channel Klaim", value=f"<#{CLAIM_CHANNEL_ID}>" if CLAIM_CHANNEL_ID else "Belum diatur", inline=False)
     embed.add_field(name="Channel Role", value=f"<#{ROLE_REQUEST_CHANNEL_ID}>" if ROLE_REQUEST_CHANNEL_ID else "Belum diatur", inline=False)
-    embed.set_footer(text="Diatur melalui Environment Variables di Railway.")
+    config_source = f"file {CONFIG_FILE_PATH}" if loaded_config_mtime is not None else "Environment Variables di Railway"
+    embed.add_field(name="Durasi Role", value="\n".join(f"**{role.title()}**: {ROLE_DURATIONS[role]}" for role in ROLE_PRIORITY) or "-", inline=False)
+    embed.set_footer(text=f"Diatur melalui {config_source}. Gunakan /reload_config setelah mengubah file config.")
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
 @bot.tree.command(name="serverlist", description="ADMIN: Menampilkan daftar semua server tempat bot ini berada.")
@@ -594,13 +1212,143 @@ async def serverlist(interaction: discord.Interaction):
     embed = discord.Embed(title=f"Bot Aktif di {len(bot.guilds)} Server", description="\n".join(server_list), color=0x3498db)
     await interaction.response.send_message(embed=embed, ephemeral=True)
 
+@bot.tree.command(name="admin_profile", description="ADMIN: Merekam profil CPU dan alokasi memori bot selama beberapa detik.")
+@is_admin()
+@app_commands.describe(detik="Lama perekaman dalam detik (1-60).")
+async def admin_profile(interaction: discord.Interaction, detik: app_commands.Range[int, 1, 60]):
+    if bot.profiling_active:
+        await interaction.response.send_message("❌ Perekaman profil lain sedang berjalan.", ephemeral=True); return
+
+    await interaction.response.defer(ephemeral=True, thinking=True)
+    bot.profiling_active = True
+    started_tracemalloc = not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start(10)
+    profiler = cProfile.Profile()
+    try:
+        # cProfile merekam thread event loop, sehingga semua handler yang berjalan selama jeda ini ikut terekam.
+        profiler.enable()
+        await asyncio.sleep(detik)
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        profiler.disable()
+        if started_tracemalloc:
+            tracemalloc.stop()
+        bot.profiling_active = False
+
+    report = io.StringIO()
+    report.write(f"=== PROFIL CPU ({detik} detik, 30 fungsi teratas berdasarkan waktu kumulatif) ===\n")
+    pstats.Stats(profiler, stream=report).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(30)
+    report.write("\n=== ALOKASI MEMORI (20 baris teratas) ===\n")
+    for stat in snapshot.statistics('lineno')[:20]:
+        report.write(f"{stat}\n")
+    report.write(f"\n=== LAG EVENT LOOP (ambang {LOOP_LAG_THRESHOLD_MS} ms) ===\n")
+    report.write(loop_lag_monitor.format_report())
+
+    filename = f"profile_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.txt"
+    file = discord.File(io.BytesIO(report.getvalue().encode('utf-8')), filename=filename)
+    await interaction.followup.send(f"📊 Hasil profil selama `{detik}` detik. Lag tercatat: **{len(loop_lag_monitor.stalls)}**.", file=file, ephemeral=True)
+
+@bot.tree.command(name="admin_stats", description="ADMIN: Menampilkan statistik klaim per role, sumber, dan waktu.")
+@is_admin()
+async def admin_stats(interaction: discord.Interaction):
+    counters = claim_analytics.counters
+    embed = discord.Embed(title="📈 Statistik Klaim", color=discord.Color.dark_green())
+    today_key = datetime.now(timezone.utc).strftime('%Y-%m-%d')
+    embed.add_field(name="Total Klaim", value=f"`{counters['total_claims']}`", inline=True)
+    embed.add_field(name="Hari Ini (UTC)", value=f"`{counters['by_day'].get(today_key, 0)}`", inline=True)
+    embed.add_field(name="24 Jam Terakhir", value=f"`{claim_analytics.claims_in_last_hours(24)}`", inline=True)
+
+    role_lines = [f"**{role.title()}**: {count}" for role, count in counters["by_role"].items()]
+    embed.add_field(name="Per Role", value="\n".join(role_lines) or "-", inline=True)
+    source_lines = [f"**{alias.title()}**: {count}" for alias, count in sorted(counters["by_source"].items())]
+    embed.add_field(name="Per Sumber", value="\n".join(source_lines) or "-", inline=True)
+    day_lines = [f"`{day}`: {counters['by_day'][day]}" for day in sorted(counters["by_day"])[-7:]]
+    embed.add_field(name="7 Hari Terakhir", value="\n".join(day_lines) or "-", inline=True)
+
+    embed.add_field(name="Ditolak (Cooldown)", value=f"`{counters['cooldown_rejections']}`", inline=True)
+    embed.add_field(name="Token Kedaluwarsa", value=f"`{counters['expiries']}`", inline=True)
+    embed.add_field(name="Reset Admin", value=f"`{counters['resets']}`", inline=True)
+    await interaction.response.send_message(embed=embed, ephemeral=True)
+
+@bot.tree.command(name="admin_export_stats", description="ADMIN: Mengunduh seluruh riwayat event klaim dalam format CSV.")
+@is_admin()
+async def admin_export_stats(interaction: discord.Interaction):
+    await interaction.response.defer(ephemeral=True, thinking=True)
+    csv_file = await asyncio.to_thread(claim_analytics.export_csv)
+    filename = f"claim_events_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.csv"
+    try:
+        await interaction.followup.send("📄 Riwayat event klaim.", file=discord.File(csv_file, filename=filename), ephemeral=True)
+    finally:
+        csv_file.close()
+
+async def reload_config() -> List[str]:
+    """Memuat, memvalidasi, dan menukar konfigurasi. Melempar ValueError tanpa mengubah apa pun jika config tidak valid."""
+    global loaded_config_mtime
+    mtime = config_file_mtime()
+    new_config = load_config()
+    removed_sources = set(TOKEN_SOURCES) - set(new_config["token_sources"])
+    added_sources = set(new_config["token_sources"]) - set(TOKEN_SOURCES)
+    apply_config(new_config)
+    loaded_config_mtime = mtime
+    if hasattr(bot, 'owner_id'):
+        bot.admin_ids = ADMIN_USER_IDS | {bot.owner_id}
+
+    changes = []
+    if added_sources:
+        changes.append(f"Sumber ditambahkan: {', '.join(sorted(added_sources))}")
+    if removed_sources:
+        changes.append(f"Sumber dihapus: {', '.join(sorted(removed_sources))}")
+        # Invalidasi state yang masih merujuk ke sumber yang dihapus.
+        if getattr(bot, 'current_claim_source_alias', None) in removed_sources:
+            changes.append(f"Sesi klaim `{bot.current_claim_source_alias}` ditutup karena sumbernya dihapus.")
+            bot.current_claim_source_alias = None
+            if bot.open_claim_message:
+                try: await bot.open_claim_message.delete()
+                except discord.HTTPException: pass
+                finally: bot.open_claim_message = None
+    print(f"Konfigurasi dimuat ulang. {' '.join(changes)}")
+    return changes
+
+@bot.tree.command(name="reload_config", description="ADMIN: Memuat ulang konfigurasi sumber token, role, admin, dan channel.")
+@is_admin()
+async def reload_config_command(interaction: discord.Interaction):
+    await interaction.response.defer(ephemeral=True)
+    try:
+        changes = await reload_config()
+    except ValueError as e:
+        await interaction.followup.send(f"❌ Konfigurasi tidak valid, konfigurasi lama tetap dipakai.\n`{e}`", ephemeral=True); return
+    summary = "\n".join(f"- {change}" for change in changes) or "Tidak ada perubahan sumber token."
+    await interaction.followup.send(f"✅ Konfigurasi berhasil dimuat ulang.\n{summary}", ephemeral=True)
+
+@tasks.loop(seconds=CONFIG_WATCH_INTERVAL)
+async def watch_config_file():
+    global loaded_config_mtime
+    mtime = config_file_mtime()
+    if mtime == loaded_config_mtime:
+        return
+    try:
+        await reload_config()
+    except ValueError as e:
+        # Tandai versi ini agar error yang sama tidak dicetak berulang kali.
+        loaded_config_mtime = mtime
+        print(f"PERINGATAN: Perubahan file config diabaikan karena tidak valid: {e}")
+
 # --- [FITUR BARU] BACKGROUND TASK UNTUK MEMBERSIHKAN TOKEN KEDALUWARSA ---
 @tasks.loop(hours=1)
 async def cleanup_expired_tokens():
     await bot.wait_until_ready() # Pastikan bot sudah siap sebelum menjalankan
     print(f"[{datetime.now()}] Menjalankan tugas pembersihan token kedaluwarsa...")
+    if github_breaker.is_open:
+        print("Pembersihan dilewati: GitHub sedang tidak tersedia.")
+        return
     async with bot.github_lock:
-        claims_content, claims_sha = get_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH)
+        try:
+            claims_content, claims_sha = get_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH)
+        except GitHubUnavailableError:
+            print("Pembersihan dibatalkan: GitHub tidak tersedia.")
+            return
         if not claims_content:
             print("Pembersihan dibatalkan: Gagal membaca claims.json.")
             return
@@ -614,6 +1362,7 @@ async def cleanup_expired_tokens():
         current_time = datetime.now(timezone.utc)
         keys_to_process = list(claims_data.keys()) # Salin kunci untuk iterasi aman
         tokens_to_remove_by_source = {}
+        expiry_events = []
         claims_updated = False
 
         for key in keys_to_process:
@@ -628,6 +1377,7 @@ async def cleanup_expired_tokens():
                     claims_updated = True
                     token = data.get("current_token")
                     alias = data.get("source_alias")
+                    expiry_events.append({"type": "expiry", "user_id": key, "source_alias": alias})
 
                     if token and alias and alias in TOKEN_SOURCES:
                         if alias not in tokens_to_remove_by_source:
@@ -652,7 +1402,11 @@ async def cleanup_expired_tokens():
 
         # Hapus token dari file sumber di GitHub
         for alias, info in tokens_to_remove_by_source.items():
-            content, sha = get_github_file(info["slug"], info["path"])
+            try:
+                content, sha = get_github_file(info["slug"], info["path"])
+            except GitHubUnavailableError:
+                print(f"Pembersihan sumber '{alias}' dilewati: GitHub tidak tersedia.")
+                continue
             if content:
                 lines = content.split('\n\n')
                 new_lines = [line for line in lines if line.strip() and line.strip() not in info["tokens"]]
@@ -663,39 +1417,60 @@ async def cleanup_expired_tokens():
                     print(f"{len(info['tokens'])} token kedaluwarsa dihapus dari sumber: {alias}")
 
         # Update claims.json
-        update_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH, json.dumps(claims_data, indent=4), claims_sha, "Bot: Bersihkan data klaim token kedaluwarsa")
-        print("Pembersihan data di claims.json selesai.")
+        if save_claims(claims_data, claims_sha, "Bot: Bersihkan data klaim token kedaluwarsa"):
+            claim_analytics.record_many(expiry_events)
+            print("Pembersihan data di claims.json selesai.")
+
+# --- BACKGROUND TASK UNTUK MEMULIHKAN CIRCUIT BREAKER GITHUB ---
+@tasks.loop(seconds=GITHUB_PROBE_INTERVAL)
+async def probe_github():
+    global last_good_claims
+    if not github_breaker.is_open:
+        return
+    try:
+        # Probe ringan langsung ke claims.json; sukses akan menutup circuit breaker dan memperbarui snapshot.
+        claims_content, _ = get_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH, bypass_breaker=True)
+    except GitHubUnavailableError:
+        print("Probe GitHub gagal, mode baca-saja tetap aktif.")
+        return
+    try:
+        last_good_claims = json.loads(claims_content if claims_content else '{}')
+    except json.JSONDecodeError:
+        pass
 
 # --- EVENT & LOOP ---
 @bot.event
 async def on_ready():
+    global last_good_claims
     bot.current_claim_source_alias = None
     bot.open_claim_message = None
     bot.close_claim_message = None
     bot.github_lock = asyncio.Lock()
+    bot.profiling_active = False
+    loop_lag_monitor.start()
 
     app_info = await bot.application_info()
     bot.owner_id = app_info.owner.id
-    try:
-        bot.admin_ids = {int(uid.strip()) for uid in ADMIN_USER_IDS_STR.split(',')} if ADMIN_USER_IDS_STR else set()
-        bot.admin_ids.add(bot.owner_id) 
-    except ValueError:
-        print("FATAL ERROR: Format ADMIN_USER_IDS tidak valid. Pastikan hanya angka dan koma.")
-        exit()
+    bot.admin_ids = ADMIN_USER_IDS | {bot.owner_id}
     
     async with bot.github_lock:
         print("Mengecek kesehatan claims.json...")
-        claims_content, claims_sha = get_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH)
-        if claims_content is None:
-            print("claims.json tidak ditemukan, membuat file baru...")
-            update_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH, "{}", None, "Bot: Initialize claims.json")
+        try:
+            claims_content, claims_sha = get_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH)
+        except GitHubUnavailableError:
+            # Jangan menginisialisasi ulang file saat GitHub hanya sedang tidak tersedia.
+            print("PERINGATAN: GitHub tidak tersedia saat health check, claims.json tidak diubah.")
         else:
-            try:
-                if not claims_content.strip(): raise json.JSONDecodeError("File is empty", claims_content, 0)
-                json.loads(claims_content)
-            except json.JSONDecodeError:
-                print("claims.json rusak atau kosong, menginisialisasi ulang file...")
-                update_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH, "{}", claims_sha, "Bot: Re-initialize corrupted claims.json")
+            if claims_content is None:
+                print("claims.json tidak ditemukan, membuat file baru...")
+                update_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH, "{}", None, "Bot: Initialize claims.json")
+            else:
+                try:
+                    if not claims_content.strip(): raise json.JSONDecodeError("File is empty", claims_content, 0)
+                    last_good_claims = json.loads(claims_content)
+                except json.JSONDecodeError:
+                    print("claims.json rusak atau kosong, menginisialisasi ulang file...")
+                    update_github_file(PRIMARY_REPO, CLAIMS_FILE_PATH, "{}", claims_sha, "Bot: Re-initialize corrupted claims.json")
     print("Health check selesai, claims.json siap digunakan.")
 
     bot.add_view(ClaimPanelView(bot))
@@ -704,6 +1479,11 @@ async def on_ready():
     # [FITUR BARU] Mulai background task
     if not cleanup_expired_tokens.is_running():
         cleanup_expired_tokens.start()
+    if not probe_github.is_running():
+        probe_github.start()
+    if not watch_config_file.is_running():
+        watch_config_file.start()
+    dm_queue.start(bot)
         
     print(f'Bot telah login sebagai {bot.user.name}')
     print(f'Owner ID: {bot.owner_id}')
@@ -711,6 +1491,8 @@ async def on_ready():
     print(f'Repo data utama (claims): {PRIMARY_REPO}')
     print(f'Server IDs: {ALLOWED_GUILD_IDS}')
     print(f'Sumber Token Terkonfigurasi: {TOKEN_SOURCES}')
+    print(f'Direktori analitik (butuh Volume agar persisten): {os.path.abspath(ANALYTICS_DIR)}')
+    print(f'File antrean DM (butuh Volume agar persisten): {os.path.abspath(DM_QUEUE_FILE)}')
 
 @bot.event
 async def on_guild_join(guild):
@@ -722,6 +1504,11 @@ async def on_guild_join(guild):
 async def on_app_command_error(interaction: discord.Interaction, error: app_commands.AppCommandError):
     if isinstance(error, app_commands.CheckFailure):
         await interaction.response.send_message("❌ **Akses Ditolak!** Perintah ini hanya untuk admin bot.", ephemeral=True)
+    elif isinstance(error, app_commands.CommandInvokeError) and isinstance(error.original, GitHubUnavailableError):
+        if interaction.response.is_done():
+            await interaction.followup.send(GITHUB_UNAVAILABLE_MESSAGE, ephemeral=True)
+        else:
+            await interaction.response.send_message(GITHUB_UNAVAILABLE_MESSAGE, ephemeral=True)
     else:
         print(f"Error tidak terduga pada perintah '{interaction.command.name if interaction.command else 'N/A'}': {error}")
         if not interaction.response.is_done():